@@ -22,6 +22,7 @@ def parse_args():
         help="重命名分类列表，可选 image video audio office 或 all",
     )
     parser.add_argument("--data-dir", help="固化数据存储目录（可选）")
+    parser.add_argument("--verify-only", action="store_true", help="仅校验链接，不重命名也不写回 Markdown")
     parser.add_argument("--ui", action="store_true", help="启动图形界面（PySide6）")
     parser.add_argument("--verbose", action="store_true", help="输出调试信息")
     return parser.parse_args()
@@ -36,7 +37,13 @@ def main():
 
     root_dir = args.root or get_app_root()
     try:
-        run_pipeline(root_dir, args.rename_types, verbose=args.verbose, data_dir=args.data_dir)
+        run_pipeline(
+            root_dir,
+            args.rename_types,
+            verbose=args.verbose,
+            data_dir=args.data_dir,
+            verify_only=args.verify_only,
+        )
     except ValueError as exc:
         logging.basicConfig(level=logging.ERROR, format='[%(levelname)s] %(message)s', force=True)
         logging.error(str(exc))
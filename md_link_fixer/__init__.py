@@ -5,9 +5,7 @@ from .core import (
     CONFIG_DIR,
     CONFIG_PATH,
     DEFAULT_RENAME_CATEGORY,
-    INDEX_FILENAME,
     LOGO_PATH,
-    MAPPING_FILENAME,
     RENAMING_CATEGORIES,
     category_label_from_types,
     category_labels,
@@ -28,9 +26,7 @@ __all__ = [
     "CONFIG_DIR",
     "CONFIG_PATH",
     "DEFAULT_RENAME_CATEGORY",
-    "INDEX_FILENAME",
     "LOGO_PATH",
-    "MAPPING_FILENAME",
     "RENAMING_CATEGORIES",
     "category_label_from_types",
     "category_labels",
@@ -6,7 +6,7 @@ Markdown attachment renamer & link fixer core (PySide-ready)
 
 功能概要：
     - 自动重命名所有未规范的非 Markdown 附件，使其具备唯一性
-      （19 位数字 + 2 位随机数）
+      （17 位时间戳 + 2 位序号）
     - 自动修复 Markdown 内所有相对路径引用：
         * 针对 markdown → 如果找不到原路径：
             - 先按文件名精确匹配
@@ -16,18 +16,23 @@ Markdown attachment renamer & link fixer core (PySide-ready)
     - 自动忽略所有以 . 开头的隐藏目录
     - 支持 ![](), [](), <img>, <image src="">
     - 纯标准库，无日志文件输出
-    - 程序结束自动删除 JSON 临时映射文件
+    - 重命名映射与文件索引只保存在内存中，从不写入磁盘
 """
 
 import json
 import logging
 import os
-import random
+import posixpath
 import re
+import shutil
+import string
 import sys
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 # ---------- 常量 ----------
 
@@ -38,8 +43,8 @@ EXCLUDE_DIR_NAMES = {
 
 MARKDOWN_EXTS = {'.md', '.markdown', '.mdown', '.mkd', '.mkdown'}
 
-MAPPING_FILENAME = 'attachment_rename_map.json'
-INDEX_FILENAME = 'file_path_index.json'
+MARKDOWN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+RENAME_WORKERS = 16
 
 RENAMING_CATEGORIES = {
     "image": {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.svg', '.tif', '.tiff', '.heic'},
@@ -159,8 +164,7 @@ def load_projects_config() -> Tuple[List[Dict], Dict]:
 def save_projects_config(projects: List[Dict], settings: Optional[Dict] = None):
     os.makedirs(CONFIG_DIR, exist_ok=True)
     payload = {"projects": projects, "settings": settings or {}}
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    write_json_atomic(CONFIG_PATH, payload, indent=2)
 
 
 def open_path(path: str):
@@ -173,27 +177,69 @@ def open_path(path: str):
         subprocess.Popen(["open" if sys.platform == "darwin" else "xdg-open", path])
 
 
+TEMP_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def write_text_atomic(path: str, content: str):
+    # 先写临时文件再 os.replace，避免写入中断导致原文件被截断；
+    # 符号链接写到真实目标，临时文件名唯一（O_EXCL），不会覆盖用户已有的同名文件
+    real = os.path.realpath(path)
+    folder, name = os.path.split(real)
+    while True:
+        tmp_path = os.path.join(folder, f".{name}.{os.urandom(4).hex()}.tmp")
+        try:
+            # 以 0o666 创建，新文件由系统按 umask 得到默认权限
+            fd = os.open(tmp_path, TEMP_FILE_FLAGS, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content.encode("utf-8"))
+        # 已有文件沿用原权限
+        if os.path.exists(real):
+            shutil.copymode(real, tmp_path)
+        os.replace(tmp_path, real)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_json_atomic(path: str, data, indent: Optional[int] = None):
+    write_text_atomic(path, json.dumps(data, ensure_ascii=False, indent=indent))
+
+
 def is_markdown_file(filename: str) -> bool:
-    return os.path.splitext(filename)[1].lower() in MARKDOWN_EXTS
+    # 等价于 os.path.splitext(filename)[1].lower() in MARKDOWN_EXTS：
+    # 只取最后一个点之后的扩展名，且点前须有非点字符（.md 这类隐藏文件无扩展名）
+    dot = filename.rfind(".")
+    return dot > 0 and filename[dot:].lower() in MARKDOWN_EXTS and filename[:dot].strip(".") != ""
 
 
 def is_normalized_filename(filename: str) -> bool:
-    name, _ = os.path.splitext(filename)
-    return name.isdigit() and len(name) == 19
+    # 主干为 19 位 ASCII 数字，其后要么结束，要么是不含点的单个扩展名；isascii 排除全角/其他脚本数字
+    stem = filename[:19]
+    if len(stem) != 19 or not (stem.isascii() and stem.isdigit()):
+        return False
+    return len(filename) == 19 or (filename[19] == "." and "." not in filename[20:])
 
 
-def generate_unique_filename(target_dir: str, ext: str, used: set) -> str:
+def iter_name_stems() -> Iterator[str]:
+    # 时间戳只取一次，同一毫秒内以两位序号递增，序号用尽后推进 1 毫秒
+    moment = datetime.now()
     while True:
-        now = datetime.now()
-        base = now.strftime("%Y%m%d%H%M%S") + f"{now.microsecond // 1000:03d}"
-        rand = f"{random.randint(0, 99):02d}"
-        new_name = f"{base}{rand}{ext}"
+        base = moment.strftime("%Y%m%d%H%M%S") + f"{moment.microsecond // 1000:03d}"
+        for seq in range(100):
+            yield f"{base}{seq:02d}"
+        moment += timedelta(milliseconds=1)
 
-        if new_name in used:
-            continue
 
-        abs_new = os.path.join(target_dir, new_name)
-        if not os.path.exists(abs_new):
+def generate_unique_filename(ext: str, used: set, stems: Iterator[str]) -> str:
+    # used 已包含索引中全部现有文件名，命中即跳过，无需再逐个 os.path.exists
+    while True:
+        new_name = f"{next(stems)}{ext}"
+        if new_name not in used:
             used.add(new_name)
             return new_name
 
@@ -219,140 +265,170 @@ def resolve_allowed_extensions(categories: Optional[List[str]]):
     return allowed, allow_all, normalized, label
 
 
-def walk_attachments(root_dir: str, self_exec: str, allowed_exts: Optional[set], allow_all: bool):
+def select_rename_candidates(
+    root_dir: str,
+    attachment_paths: List[str],
+    self_exec: str,
+    allowed_exts: Optional[set],
+    allow_all: bool,
+):
+    # 直接从文件索引筛选，不再单独遍历目录树；索引的附件列表已不含 Markdown
     result = []
+    root_abs = os.path.abspath(root_dir)
+    self_exec_abs = os.path.abspath(self_exec)
 
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        # 忽略以 . 开头目录，以及特殊目录和 .app
-        dirnames[:] = [
-            d for d in dirnames
-            if not d.startswith('.')
-            and d not in EXCLUDE_DIR_NAMES
-            and not d.endswith('.app')
-        ]
-
-        for filename in filenames:
-            abs_path = os.path.join(dirpath, filename)
-            rel_path = os.path.relpath(abs_path, root_dir)
+    for rel_path in attachment_paths:
+        filename = rel_path.rpartition("/")[2]
+        abs_path = os.path.join(root_abs, rel_path.replace("/", os.sep))
 
-            if os.path.abspath(abs_path) == os.path.abspath(self_exec):
-                continue
-            if filename.lower().endswith('.exe'):
-                continue
-            if is_markdown_file(filename):
-                continue
-            if is_normalized_filename(filename):
-                continue
-            _, ext = os.path.splitext(filename)
-            ext = ext.lower()
-            if not allow_all and allowed_exts is not None and ext not in allowed_exts:
-                continue
+        if abs_path == self_exec_abs:
+            continue
+        if filename.lower().endswith('.exe'):
+            continue
+        if is_normalized_filename(filename):
+            continue
+        _, ext = os.path.splitext(filename)
+        if not allow_all and allowed_exts is not None and ext.lower() not in allowed_exts:
+            continue
 
-            result.append((abs_path, rel_path))
+        # 扩展名随候选一并返回，重命名时无需再拆分一次
+        result.append((abs_path, rel_path, ext))
 
     return result
 
 
-def rename_attachments(root_dir: str, self_exec: str, allowed_exts: Optional[set], allow_all: bool):
-    attachments = walk_attachments(root_dir, self_exec, allowed_exts, allow_all)
+def try_rename(abs_old: str, abs_new: str) -> Optional[Exception]:
+    try:
+        os.rename(abs_old, abs_new)
+    except Exception as e:
+        return e
+    return None
+
+
+def rename_attachments(
+    root_dir: str,
+    attachment_paths: List[str],
+    self_exec: str,
+    allowed_exts: Optional[set],
+    allow_all: bool,
+):
+    attachments = select_rename_candidates(root_dir, attachment_paths, self_exec, allowed_exts, allow_all)
     logging.info(f"检测到未规范附件：{len(attachments)} 个")
 
     mapping = {}
-    used = set()
+    used = {p.rpartition("/")[2] for p in attachment_paths}
+    stems = iter_name_stems()
     renamed = 0
     details = []
 
-    for abs_old, rel_old in attachments:
+    # 新文件名依赖 used 集合，必须串行生成；实际 os.rename 交给线程池并发执行
+    plans = []
+    for abs_old, rel_old_posix, ext in attachments:
         dirpath, filename = os.path.split(abs_old)
-        _, ext = os.path.splitext(filename)
 
-        new_name = generate_unique_filename(dirpath, ext, used)
+        new_name = generate_unique_filename(ext, used, stems)
         abs_new = os.path.join(dirpath, new_name)
 
-        rel_old_posix = rel_old.replace(os.sep, "/")
-        rel_new_posix = os.path.relpath(abs_new, root_dir).replace(os.sep, "/")
+        rel_dir = rel_old_posix.rpartition("/")[0]
+        rel_new_posix = f"{rel_dir}/{new_name}" if rel_dir else new_name
 
         logging.info(f"重命名：{rel_old_posix} → {rel_new_posix}")
-
-        try:
-            os.rename(abs_old, abs_new)
+        plans.append((abs_old, abs_new, rel_old_posix, rel_new_posix, filename, new_name, rel_dir))
+
+    with ThreadPoolExecutor(max_workers=RENAME_WORKERS) as executor:
+        errors = executor.map(lambda plan: try_rename(plan[0], plan[1]), plans)
+        for plan, error in zip(plans, errors):
+            _, _, rel_old_posix, rel_new_posix, filename, new_name, rel_dir = plan
+            if error is not None:
+                logging.error(f"重命名失败：{rel_old_posix}，错误：{error}")
+                continue
             mapping[rel_old_posix] = rel_new_posix
             renamed += 1
-            rel_dir = os.path.dirname(rel_old_posix)
             details.append({
-                "old": os.path.basename(rel_old_posix),
-                "new": os.path.basename(rel_new_posix),
+                "old": filename,
+                "new": new_name,
                 "path": rel_dir,
             })
-        except Exception as e:
-            logging.error(f"重命名失败：{rel_old_posix}，错误：{e}")
 
     return mapping, len(attachments), renamed, details
 
 
-def save_mapping(root_dir: str, mapping: Dict[str, str], data_dir: Optional[str] = None) -> str:
-    target_dir = data_dir or root_dir
-    os.makedirs(target_dir, exist_ok=True)
-    path = os.path.join(target_dir, MAPPING_FILENAME)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump({"files": [
-            {"old": k, "new": v} for k, v in mapping.items()
-        ]}, f, ensure_ascii=False, indent=2)
-    return path
-
 # ---------- 文件索引 ----------
 
 def build_file_index(root_dir: str):
     index = {"markdown": [], "attachments": []}
+    markdown, attachments = index["markdown"], index["attachments"]
 
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-
-        dirnames[:] = [
-            d for d in dirnames
-            if not d.startswith(".")
-            and d not in EXCLUDE_DIR_NAMES
-            and not d.endswith(".app")
-        ]
+    # 单次 scandir 深度优先遍历（目录顺序与 os.walk 一致），DirEntry 自带类型信息，免去逐个 stat
+    pending = [(root_dir, "")]
+    while pending:
+        dir_path, rel_dir = pending.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
 
-        for filename in filenames:
-            abs_path = os.path.join(dirpath, filename)
-            rel_posix = os.path.relpath(abs_path, root_dir).replace(os.sep, "/")
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                # 忽略以 . 开头目录，以及特殊目录和 .app；与 os.walk 一样不跟随目录符号链接
+                if (
+                    not name.startswith(".")
+                    and name not in EXCLUDE_DIR_NAMES
+                    and not name.endswith(".app")
+                    and not entry.is_symlink()
+                ):
+                    subdirs.append((entry.path, f"{rel_dir}{name}/"))
+                continue
 
-            if is_markdown_file(filename):
-                index["markdown"].append(rel_posix)
+            if is_markdown_file(name):
+                markdown.append(rel_dir + name)
             else:
-                index["attachments"].append(rel_posix)
+                attachments.append(rel_dir + name)
+
+        pending.extend(reversed(subdirs))
 
-    logging.info(f"索引完成：Markdown {len(index['markdown'])} 个，附件 {len(index['attachments'])} 个")
+    logging.info(f"索引完成：Markdown {len(markdown)} 个，附件 {len(attachments)} 个")
     return index
 
 
-def save_index(root_dir: str, index: Dict[str, List[str]], data_dir: Optional[str] = None) -> str:
-    target_dir = data_dir or root_dir
-    os.makedirs(target_dir, exist_ok=True)
-    path = os.path.join(target_dir, INDEX_FILENAME)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump({"files": index}, f, ensure_ascii=False, indent=2)
-    return path
+def apply_rename_mapping(index: Dict[str, List[str]], mapping: Dict[str, str]):
+    # 重命名后的文件树 = 重命名前索引 + 映射，无需再次遍历
+    if not mapping:
+        return index
+    return {
+        "markdown": index["markdown"],
+        "attachments": [mapping.get(p, p) for p in index["attachments"]],
+    }
 
 
 def detect_duplicate_filenames(index: Dict[str, List[str]]):
-    buckets = {}
-    for rel in index.get("markdown", []) + index.get("attachments", []):
-        name = os.path.basename(rel)
-        buckets.setdefault(name, []).append(rel)
-
-    duplicates = {k: v for k, v in buckets.items() if len(v) > 1}
-    if not duplicates:
+    all_rels = index.get("markdown", []) + index.get("attachments", [])
+    basenames = [rel.rpartition("/")[2] for rel in all_rels]
+    # 先计数，仅为真正重名的文件名收集路径
+    dup_names = {name for name, count in Counter(basenames).items() if count > 1}
+    if not dup_names:
         return {}, "未发现重复命名文件。", []
 
+    duplicates = {name: [] for name in dup_names}
+    for name, rel in zip(basenames, all_rels):
+        if name in dup_names:
+            duplicates[name].append(rel)
+
     lines = ["| 文件名 | 路径 |", "| --- | --- |"]
     dup_list = []
     for name in sorted(duplicates.keys()):
-        paths = "<br>".join(sorted(duplicates[name]))
-        lines.append(f"| `{name}` | {paths} |")
-        for p in sorted(duplicates[name]):
-            dup_list.append({"name": name, "path": p})
+        # 每组路径只排序一次，表格与列表共用
+        paths = sorted(duplicates[name])
+        lines.append(f"| `{name}` | {'<br>'.join(paths)} |")
+        dup_list.extend({"name": name, "path": p} for p in paths)
 
     return duplicates, "\n".join(lines), dup_list
 
@@ -363,8 +439,8 @@ def write_reports(data_dir: str, summary: Dict):
     json_path = os.path.join(data_dir, "latest_summary.json")
     md_path = os.path.join(data_dir, "latest_report.md")
 
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, ensure_ascii=False, indent=2)
+    # 供程序读取的摘要紧凑写出；可读版本见 latest_report.md
+    write_json_atomic(json_path, summary)
 
     lines = [
         "# 运行报告",
@@ -391,8 +467,7 @@ def write_reports(data_dir: str, summary: Dict):
         for item in invalid_refs:
             lines.append(f"| `{item.get('file', '')}` | {item.get('link', '')} |")
 
-    with open(md_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    write_text_atomic(md_path, "\n".join(lines))
 
     logging.info(f"报告已写入：{json_path} , {md_path}")
 
@@ -404,84 +479,119 @@ HTML_SRC_PATTERN = re.compile(
     r'(<(?:img|image)\b[^>]*?\s(?:src|href)\s*=\s*["\'])([^"\']+)(["\'])',
     re.IGNORECASE
 )
+MD_LINK_BODY_PATTERN = re.compile(r'^(\s*<?)([^>\s]+)(>?)(.*)$', re.DOTALL)
+EXTERNAL_PREFIXES = ("http://", "https://", "ftp://", "mailto:", "tel:", "data:")
+ASCII_LETTERS = frozenset(string.ascii_letters)
 
 def is_external_or_absolute(path: str) -> bool:
-    p = path.lower()
-    return (
-        p.startswith(("http://", "https://", "ftp://", "mailto:", "tel:", "data:"))
-        or p.startswith("//")
-        or p.startswith("#")
-        or path.startswith(("/", "\\"))
-        or re.match(r"^[a-zA-Z]:[\\/]", path)
-    )
+    if not path:
+        return False
+    # 以 /、\、# 开头（含 // 协议相对地址）
+    if path[0] in "/\\#":
+        return True
+    if path[:8].lower().startswith(EXTERNAL_PREFIXES):
+        return True
+    # Windows 盘符路径，如 C:/ 或 C:\
+    return len(path) >= 3 and path[1] == ":" and path[2] in "\\/" and path[0] in ASCII_LETTERS
 
 
-def find_attachment_by_filename(filename: str, attachments: List[str]):
-    candidates = [p for p in attachments if os.path.basename(p) == filename]
-    return candidates[0] if len(candidates) == 1 else None
+HTML_TAG_MARKERS = ("<im", "<iM", "<Im", "<IM")
+
+def has_link_candidates(content: str) -> bool:
+    # 廉价预筛：无 "](" 且无 <img / <image（大小写不敏感）时，链接正则不可能命中；
+    # 逐个枚举大小写组合，避免对整篇内容 lower() 复制
+    return "](" in content or any(marker in content for marker in HTML_TAG_MARKERS)
+
 
+LINK_MARKER_BYTES = (b"](",) + tuple(marker.encode("ascii") for marker in HTML_TAG_MARKERS)
 
-def find_markdown_by_filename(filename: str, markdown_paths: List[str]):
-    all_mds = [p for p in markdown_paths if p.lower().endswith(".md")]
+def has_link_candidate_bytes(raw: bytes) -> bool:
+    # 同上，但直接作用于原始字节：标记均为 ASCII，UTF-8 下字节匹配与字符匹配等价，无候选时可省去解码
+    return any(marker in raw for marker in LINK_MARKER_BYTES)
 
+
+def build_basename_index(paths: List[str]) -> Dict[str, List[str]]:
+    # 文件名 → 相对路径列表，按文件名查找时 O(1)
+    by_name: Dict[str, List[str]] = {}
+    for p in paths:
+        by_name.setdefault(p.rpartition("/")[2], []).append(p)
+    return by_name
+
+
+def find_attachment_by_filename(filename: str, attachments_by_name: Dict[str, List[str]]):
+    candidates = attachments_by_name.get(filename, ())
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def find_markdown_by_filename(filename: str, markdown_by_name: Dict[str, List[str]]):
+    # markdown_by_name 已预先筛为 .md 文件
     # 精确匹配
-    exact = [p for p in all_mds if os.path.basename(p) == filename]
+    exact = markdown_by_name.get(filename, ())
     if len(exact) == 1:
         return exact[0]
     if len(exact) > 1:
         return None
 
-    # 模糊匹配（两端模糊）
+    # 模糊匹配（两端模糊），仅在精确匹配落空时线性扫描
     lower_name = filename.lower()
-    fuzzy = [p for p in all_mds if lower_name in os.path.basename(p).lower()]
+    fuzzy = [p for name, paths in markdown_by_name.items() if lower_name in name.lower() for p in paths]
 
     if len(fuzzy) == 1:
         return fuzzy[0]
     return None  # 多个 or 0 个
 
 
+@lru_cache(maxsize=4096)
+def relative_link(target_rel: str, md_dir_rel: str) -> str:
+    # 两者均为根目录下的 posix 相对路径：去掉公共前缀，剩余层级用 .. 回退；
+    # 纯字符串运算可安全缓存，同一附件被多处引用时直接命中
+    target_parts = target_rel.split("/")
+    base_parts = md_dir_rel.split("/") if md_dir_rel else []
+    common = 0
+    for a, b in zip(target_parts, base_parts):
+        if a != b:
+            break
+        common += 1
+    return "/".join([".."] * (len(base_parts) - common) + target_parts[common:])
+
+
 def transform_path(
     url: str,
     md_dir: str,
-    root_dir: str,
+    md_dir_rel: str,
     mapping: Dict[str, str],
-    markdown_paths: List[str],
-    attachment_paths: List[str],
+    markdown_by_name: Dict[str, List[str]],
+    attachments_by_name: Dict[str, List[str]],
+    existing_paths: Set[str],
 ):
     url = url.strip()
 
     if not url or is_external_or_absolute(url):
         return url, True
 
-    abs_candidate = None
+    # 以根目录下的 posix 相对路径比对映射与索引，直接按字符串归一化，无需 relpath / stat
+    rel_from_root = posixpath.normpath(posixpath.join(md_dir_rel, url.replace(os.sep, "/")))
+
     # 映射修复
-    try:
-        abs_candidate = os.path.normpath(os.path.join(md_dir, url))
-        rel_from_root = os.path.relpath(abs_candidate, root_dir).replace(os.sep, "/")
-    except Exception:
-        rel_from_root = None
+    new_rel = mapping.get(rel_from_root) if mapping else None
+    if new_rel and new_rel in existing_paths:
+        return relative_link(new_rel, md_dir_rel), True
 
-    if rel_from_root and rel_from_root in mapping:
-        new_rel = mapping[rel_from_root]
-        new_abs = os.path.join(root_dir, new_rel.replace("/", os.sep))
-        if os.path.exists(new_abs):
-            return os.path.relpath(new_abs, md_dir).replace(os.sep, "/"), True
+    # 原路径仍然存在（未被重命名）即为有效链接，无需文件名搜索；
+    # 索引不含隐藏目录与目录本身，未命中时再回退到 os.path.exists
+    if rel_from_root in existing_paths or os.path.exists(os.path.join(md_dir, url)):
+        return url, True
 
     filename = os.path.basename(url)
 
     # Markdown 文件特殊处理
     if filename.lower().endswith(".md"):
-        found_rel = find_markdown_by_filename(filename, markdown_paths)
+        found_rel = find_markdown_by_filename(filename, markdown_by_name)
     else:
-        found_rel = find_attachment_by_filename(filename, attachment_paths)
+        found_rel = find_attachment_by_filename(filename, attachments_by_name)
 
-    if found_rel:
-        new_abs = os.path.join(root_dir, found_rel.replace("/", os.sep))
-        if os.path.exists(new_abs):
-            return os.path.relpath(new_abs, md_dir).replace(os.sep, "/"), True
-
-    if abs_candidate and os.path.exists(abs_candidate):
-        return url, True
+    if found_rel and found_rel in existing_paths:
+        return relative_link(found_rel, md_dir_rel), True
 
     return url, False
 
@@ -491,105 +601,158 @@ def replace_in_markdown(
     md_abs_path: str,
     root_dir: str,
     mapping: Dict[str, str],
-    markdown_paths: List[str],
-    attachment_paths: List[str]
+    markdown_by_name: Dict[str, List[str]],
+    attachments_by_name: Dict[str, List[str]],
+    existing_paths: Set[str],
 ):
+    if not has_link_candidates(content):
+        return content, 0, []
+
     md_dir = os.path.dirname(md_abs_path)
+    # md_abs_path 由 root_dir 拼接而来，直接截掉根目录前缀即可，无需 relpath
+    md_dir_rel = md_dir[len(root_dir):].lstrip(os.sep).replace(os.sep, "/")
     replaced_count = 0
     broken_links: List[str] = []
 
-    def md_repl(match):
-        nonlocal replaced_count
-        prefix, body, suffix = match.groups()
-
-        m = re.match(r'^(\s*<?)([^>\s]+)(>?)(.*)$', body, re.DOTALL)
-        if not m:
-            return match.group(0)
+    # 同一文件内重复引用的 URL 只解析一次，缓存随本次调用结束释放
+    @lru_cache(maxsize=None)
+    def resolve(url: str):
+        return transform_path(
+            url, md_dir, md_dir_rel, mapping, markdown_by_name, attachments_by_name, existing_paths
+        )
 
-        pre, url, angle, tail = m.groups()
-        new_url, resolved = transform_path(url, md_dir, root_dir, mapping, markdown_paths, attachment_paths)
+    def rewrite(url: str) -> str:
+        nonlocal replaced_count
+        new_url, resolved = resolve(url)
 
         if new_url != url:
             replaced_count += 1
         if not resolved:
             broken_links.append(url)
+        return new_url
 
-        return f"{prefix}{pre}{new_url}{angle}{tail}{suffix}"
+    def md_repl(match):
+        md_prefix, body, md_suffix = match.groups()
+        # 常见情形：无空白、无尖括号，正则结果必然是整个 body 作为 URL，直接跳过匹配
+        if "<" not in body and ">" not in body and body.split() == [body]:
+            pre, url, angle, tail = "", body, "", ""
+        else:
+            m = MD_LINK_BODY_PATTERN.match(body)
+            if not m:
+                return match.group(0)
+            pre, url, angle, tail = m.groups()
+        return f"{md_prefix}{pre}{rewrite(url)}{angle}{tail}{md_suffix}"
 
     def html_repl(match):
-        nonlocal replaced_count
         prefix, url, suffix = match.groups()
+        return f"{prefix}{rewrite(url)}{suffix}"
 
-        new_url, resolved = transform_path(url, md_dir, root_dir, mapping, markdown_paths, attachment_paths)
+    # 先 Markdown 后 HTML 两遍扫描：两种语法可以互相嵌套（带链接的徽章 [<img src=...>](...)、
+    # alt 中的 ![](...)），单次合并扫描的匹配不能重叠，会漏掉内层链接；没有对应标记的一遍直接跳过
+    if "](" in content:
+        content = MD_LINK_PATTERN.sub(md_repl, content)
+    if any(marker in content for marker in HTML_TAG_MARKERS):
+        content = HTML_SRC_PATTERN.sub(html_repl, content)
 
-        if new_url != url:
-            replaced_count += 1
-        if not resolved:
-            broken_links.append(url)
+    return content, replaced_count, broken_links
 
-        return f"{prefix}{new_url}{suffix}"
 
-    content = MD_LINK_PATTERN.sub(md_repl, content)
-    content = HTML_SRC_PATTERN.sub(html_repl, content)
+def fix_markdown_file(
+    root_dir: str,
+    rel_md: str,
+    mapping: Dict[str, str],
+    markdown_by_name: Dict[str, List[str]],
+    attachments_by_name: Dict[str, List[str]],
+    existing_paths: Set[str],
+    write: bool = True,
+):
+    abs_md = os.path.join(root_dir, rel_md.replace("/", os.sep))
+    logging.info(f"处理 Markdown：{rel_md}")
 
-    return content, replaced_count, broken_links
+    try:
+        # 整体读取字节后一次性解码，不经过 TextIOWrapper；BOM 作为 \ufeff 保留并原样写回
+        with open(abs_md, "rb") as f:
+            raw = f.read()
+        if not has_link_candidate_bytes(raw):
+            return 0, []
+        content = raw.decode("utf-8")
+    except Exception as e:
+        logging.error(f"读取失败：{rel_md}，{e}")
+        return None
+
+    new_content, count, broken_links = replace_in_markdown(
+        content, abs_md, root_dir, mapping, markdown_by_name, attachments_by_name, existing_paths
+    )
+
+    if not write or new_content == content:
+        return 0, broken_links
+
+    write_text_atomic(abs_md, new_content)
+    return count, broken_links
 
 
-def process_markdown_files(root_dir: str, index: Dict[str, List[str]], mapping: Dict[str, str]):
+def process_markdown_files(
+    root_dir: str,
+    index: Dict[str, List[str]],
+    mapping: Dict[str, str],
+    verify_only: bool = False,
+):
     markdown_paths = index["markdown"]
-    attachment_paths = index["attachments"]
+    if verify_only:
+        # 仅校验：不查找候选、不写回，原样无法解析的链接即记为失效
+        markdown_by_name, attachments_by_name = {}, {}
+    else:
+        # 链接查找只针对 .md，筛选一次即可
+        markdown_by_name = build_basename_index(
+            [p for p in markdown_paths if p.lower().endswith(".md")]
+        )
+        attachments_by_name = build_basename_index(index["attachments"])
+    existing_paths = set(markdown_paths)
+    existing_paths.update(index["attachments"])
 
     total_files = 0
     total_replacements = 0
     changed_files = []
     invalid_references = []
 
-    for rel_md in markdown_paths:
-        abs_md = os.path.join(root_dir, rel_md.replace("/", os.sep))
-        logging.info(f"处理 Markdown：{rel_md}")
-
-        try:
-            with open(abs_md, "r", encoding="utf-8") as f:
-                content = f.read()
-        except Exception as e:
-            logging.error(f"读取失败：{rel_md}，{e}")
-            continue
-
-        new_content, count, broken_links = replace_in_markdown(
-            content, abs_md, root_dir, mapping, markdown_paths, attachment_paths
+    # 各 Markdown 相互独立，线程池并发读写；map 保持原顺序，汇总结果稳定
+    with ThreadPoolExecutor(max_workers=MARKDOWN_WORKERS) as executor:
+        results = executor.map(
+            lambda rel_md: fix_markdown_file(
+                root_dir, rel_md, mapping, markdown_by_name, attachments_by_name, existing_paths,
+                write=not verify_only,
+            ),
+            markdown_paths,
         )
+        for rel_md, result in zip(markdown_paths, results):
+            if result is None:
+                continue
+            count, broken_links = result
 
-        for link in broken_links:
-            invalid_references.append({"file": rel_md, "link": link})
+            for link in broken_links:
+                invalid_references.append({"file": rel_md, "link": link})
 
-        if count == 0:
-            continue
-
-        total_files += 1
-        total_replacements += count
-        changed_files.append(rel_md)
+            if count == 0:
+                continue
 
-        with open(abs_md, "w", encoding="utf-8") as f:
-            f.write(new_content)
+            total_files += 1
+            total_replacements += count
+            changed_files.append(rel_md)
 
     logging.info(f"Markdown 修复完成：修改 {total_files} 个文件，共 {total_replacements} 处替换")
     return total_files, total_replacements, changed_files, invalid_references
 
 
-# ---------- 删除临时文件 ----------
-
-def safe_delete(path: str):
-    if os.path.exists(path):
-        try:
-            os.remove(path)
-            logging.info(f"已删除临时文件：{path}")
-        except Exception as e:
-            logging.error(f"删除失败：{path} 错误：{e}")
-
-
 # ---------- 主程序 ----------
 
-def run_pipeline(root_dir: str, rename_categories: Optional[List[str]], verbose=False, extra_handlers=None, data_dir: Optional[str] = None):
+def run_pipeline(
+    root_dir: str,
+    rename_categories: Optional[List[str]],
+    verbose=False,
+    extra_handlers=None,
+    data_dir: Optional[str] = None,
+    verify_only: bool = False,
+):
     root_dir = normalize_display_path(os.path.abspath(root_dir))
     allowed_exts, allow_all, normalized_types, category_label = resolve_allowed_extensions(rename_categories)
 
@@ -601,24 +764,25 @@ def run_pipeline(root_dir: str, rename_categories: Optional[List[str]], verbose=
     logging.info(f" 重命名分类：{category_label}")
     logging.info("====================================")
 
-    random.seed()
-
     self_exec = sys.executable if getattr(sys, "frozen", False) else os.path.abspath(__file__)
 
     # Duplicate report should reflect the state BEFORE any renaming.
     index_before = build_file_index(root_dir)
     duplicates, duplicate_table, duplicate_list = detect_duplicate_filenames(index_before)
 
-    mapping, detected, renamed, rename_details = rename_attachments(root_dir, self_exec, allowed_exts, allow_all)
-    mapping_path = save_mapping(root_dir, mapping, data_dir)
-
-    index_after = build_file_index(root_dir)
-    index_path = save_index(root_dir, index_after, data_dir)
-
-    md_files, replacements, changed_files, invalid_refs = process_markdown_files(root_dir, index_after, mapping)
+    if verify_only:
+        logging.info("仅校验模式：跳过重命名与写回")
+        mapping, detected, renamed, rename_details = {}, 0, 0, []
+    else:
+        mapping, detected, renamed, rename_details = rename_attachments(
+            root_dir, index_before["attachments"], self_exec, allowed_exts, allow_all
+        )
+    # 映射与索引只在内存中流转，不再落盘临时 JSON
+    index_after = apply_rename_mapping(index_before, mapping)
 
-    safe_delete(mapping_path)
-    safe_delete(index_path)
+    md_files, replacements, changed_files, invalid_refs = process_markdown_files(
+        root_dir, index_after, mapping, verify_only=verify_only
+    )
 
     logging.info("------ 重复命名检查 ------")
     logging.info(duplicate_table)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -23,37 +25,103 @@ from .core import (
 )
 
 
+APP_STYLESHEET = """
+QWidget { font-family: 'Segoe UI', 'Microsoft YaHei', sans-serif; font-size: 13px; color: #1f2937; }
+QFrame#Card { background: #ffffff; border: 1px solid #e5e7eb; border-radius: 12px; }
+QLabel#SectionTitle { font-size: 16px; font-weight: 700; }
+QLabel#Muted { color: #6b7280; }
+QLabel#CardTitle { color: #6b7280; font-size: 12px; }
+QLabel#CardValue { font-size: 22px; font-weight: 700; color: #111827; }
+QFrame#ProjectCard { background: #ffffff; border: 1px solid #e5e7eb; border-radius: 12px; }
+QFrame#ProjectCard[selected=\"true\"] { border: 2px solid #2563eb; }
+QLabel#ProjectName { font-size: 14px; font-weight: 700; }
+QLabel#ProjectMeta { color: #6b7280; }
+QPushButton { background: #2563eb; color: white; padding: 8px 14px; border-radius: 8px; border: none; }
+QPushButton:hover { background: #1d4ed8; }
+QPushButton:disabled { background: #93c5fd; }
+QPushButton#SoftButton { background: #f3f4f6; color: #111827; border: 1px solid #e5e7eb; }
+QPushButton#SoftButton:hover { background: #e5e7eb; }
+QToolButton#ActionButton,
+QToolButton#ActionButtonPrimary,
+QToolButton#ActionButtonDanger {
+    border-radius: 10px;
+    border: 1px solid #e5e7eb;
+    background: #ffffff;
+}
+QToolButton#ActionButton:hover { background: #f3f4f6; }
+QToolButton#ActionButtonPrimary { border: none; background: #2563eb; color: white; }
+QToolButton#ActionButtonPrimary:hover { background: #1d4ed8; }
+QToolButton#ActionButtonPrimary:disabled { background: #93c5fd; }
+QToolButton#ActionButtonDanger { background: #fff1f2; border: 1px solid #fecdd3; }
+QToolButton#ActionButtonDanger:hover { background: #ffe4e6; }
+QLineEdit { border: 1px solid #d1d5db; border-radius: 8px; padding: 8px; }
+QTabWidget::pane { border: 1px solid #e5e7eb; border-radius: 10px; padding: 6px; }
+QTabBar::tab { padding: 8px 14px; margin-right: 4px; border: 1px solid #e5e7eb; border-bottom: none; border-top-left-radius: 8px; border-top-right-radius: 8px; background: #f3f4f6; }
+QTabBar::tab:selected { background: #ffffff; color: #1f2937; }
+QPlainTextEdit { border: 1px solid #e5e7eb; border-radius: 10px; background: #0f172a; color: #e2e8f0; font-family: 'JetBrains Mono', 'Consolas', monospace; }
+QTableView { border: 1px solid #e5e7eb; border-radius: 10px; }
+QHeaderView::section { background: #f3f4f6; padding: 6px; border: none; }
+"""
+
+
 class SignalLogHandler(logging.Handler):
-    """Redirect logging output to a Qt signal."""
+    """Redirect logging output to a Qt signal, coalescing records into batches."""
+
+    FLUSH_INTERVAL = 0.1
 
     def __init__(self, signal: QtCore.SignalInstance):
         super().__init__()
         self.signal = signal
+        self._buffer: List[str] = []
+        self._buffer_lock = threading.Lock()
+        self._last_flush = time.monotonic()
 
     def emit(self, record: logging.LogRecord):
         try:
             msg = self.format(record)
         except Exception:
             msg = record.getMessage()
-        self.signal.emit(msg)
-
-
-class PipelineWorker(QtCore.QThread):
-    log = QtCore.Signal(str)
-    finished = QtCore.Signal(dict)
+        # 记录可能来自流水线的多个工作线程；攒够一个间隔再整批发出，避免每条日志一次跨线程信号。
+        # 排队信号的 emit 不会阻塞，在锁内发出以保证各批次按顺序到达
+        with self._buffer_lock:
+            self._buffer.append(msg)
+            if time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+                self.signal.emit(self._take_buffer())
+
+    def flush(self):
+        # 间隔内没有后续日志时缓冲不会自动发出，GUI 线程在运行期间定时调用本方法
+        with self._buffer_lock:
+            if self._buffer:
+                self.signal.emit(self._take_buffer())
+
+    def _take_buffer(self) -> List[str]:
+        batch, self._buffer = self._buffer, []
+        self._last_flush = time.monotonic()
+        return batch
+
+
+class PipelineSignals(QtCore.QObject):
+    logs = QtCore.Signal(list)
+    finished = QtCore.Signal(dict, dict)
     failed = QtCore.Signal(str)
 
+
+class PipelineTask(QtCore.QRunnable):
     def __init__(self, root_dir: str, rename_types: List[str], data_dir: Optional[str], verbose: bool):
         super().__init__()
+        # QRunnable 不是 QObject，信号挂在独立的信号对象上，由调用方持有引用
+        self.signals = PipelineSignals()
         self.root_dir = root_dir
         self.rename_types = rename_types
         self.data_dir = data_dir
         self.verbose = verbose
+        # 处理器在创建任务时生成，调用方可在 GUI 线程定时 flush
+        self.log_handler = SignalLogHandler(self.signals.logs)
+        self.log_handler.setLevel(logging.DEBUG)
+        self.log_handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
 
     def run(self):
-        handler = SignalLogHandler(self.log)
-        handler.setLevel(logging.DEBUG)
-        handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+        handler = self.log_handler
         try:
             summary = run_pipeline(
                 self.root_dir,
@@ -62,9 +130,15 @@ class PipelineWorker(QtCore.QThread):
                 extra_handlers=[handler],
                 data_dir=self.data_dir,
             )
-            self.finished.emit(summary)
         except Exception as exc:  # noqa: BLE001
-            self.failed.emit(str(exc))
+            handler.flush()
+            self.signals.failed.emit(str(exc))
+            return
+        # 表格行在工作线程中生成，GUI 线程只需交给模型
+        rows = build_summary_rows(summary)
+        # 先送出缓冲中的剩余日志，再通知完成
+        handler.flush()
+        self.signals.finished.emit(summary, rows)
 
 
 class TagChip(QtWidgets.QLabel):
@@ -75,6 +149,18 @@ class TagChip(QtWidgets.QLabel):
         self.setAlignment(QtCore.Qt.AlignCenter)
 
 
+def make_card(
+    spacing: int, margins: Tuple[int, int, int, int] = (14, 12, 14, 12)
+) -> Tuple[QtWidgets.QFrame, QtWidgets.QVBoxLayout]:
+    """Create a "Card"-styled frame with its vertical layout."""
+    card = QtWidgets.QFrame()
+    card.setObjectName("Card")
+    layout = QtWidgets.QVBoxLayout(card)
+    layout.setContentsMargins(*margins)
+    layout.setSpacing(spacing)
+    return card, layout
+
+
 class SummaryCard(QtWidgets.QFrame):
     def __init__(self, title: str, tooltip: str = "", parent: Optional[QtWidgets.QWidget] = None):
         super().__init__(parent)
@@ -97,6 +183,135 @@ class SummaryCard(QtWidgets.QFrame):
         self.value_label.setText(text)
 
 
+class CategoryPicker(QtWidgets.QWidget):
+    """Row of rename-category checkboxes; "all" is exclusive with the individual categories."""
+
+    # (键, 显示名) 在类定义时生成一次，各对话框构建复选框时直接复用
+    ITEMS = tuple((key, CATEGORY_LABELS.get(key, key)) for key in [*RENAMING_CATEGORIES, "all"])
+
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
+        super().__init__(parent)
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+        self.boxes: Dict[str, QtWidgets.QCheckBox] = {}
+        for key, label in self.ITEMS:
+            cb = QtWidgets.QCheckBox(label)
+            cb.setProperty("cat-key", key)
+            cb.stateChanged.connect(self._on_category_changed)
+            self.boxes[key] = cb
+            layout.addWidget(cb)
+        layout.addStretch()
+
+    def _on_category_changed(self):
+        sender = self.sender()
+        if not isinstance(sender, QtWidgets.QCheckBox):
+            return
+        cat_key = sender.property("cat-key")
+        if cat_key == "all" and sender.isChecked():
+            # 取消其他分类时屏蔽其信号，避免每个复选框再回调一次本方法
+            for key, box in self.boxes.items():
+                if key != "all":
+                    box.blockSignals(True)
+                    box.setChecked(False)
+                    box.blockSignals(False)
+        elif cat_key != "all" and sender.isChecked():
+            all_box = self.boxes["all"]
+            all_box.blockSignals(True)
+            all_box.setChecked(False)
+            all_box.blockSignals(False)
+
+    def set_values(self, categories: List[str]):
+        normalized = normalize_categories(categories)
+        selected = frozenset(normalized)
+        # 批量勾选期间暂停重绘，整组复选框只重绘一次；信号仍需逐个屏蔽（父控件屏蔽不影响子控件）
+        self.setUpdatesEnabled(False)
+        for key, box in self.boxes.items():
+            box.blockSignals(True)
+            box.setChecked(key in selected)
+            box.blockSignals(False)
+        self.setUpdatesEnabled(True)
+        if not normalized:
+            self.boxes[DEFAULT_RENAME_CATEGORY].setChecked(True)
+
+    def values(self) -> List[str]:
+        selected = [key for key, box in self.boxes.items() if box.isChecked()]
+        return normalize_categories(selected) or [DEFAULT_RENAME_CATEGORY]
+
+
+class SummaryTableModel(QtCore.QAbstractTableModel):
+    """Read-only rows for the summary tables; column 0 is the 1-based row number."""
+
+    def __init__(self, headers: List[str], parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows: List[tuple] = []
+
+    def set_rows(self, rows: List[tuple]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+        if role == QtCore.Qt.DisplayRole:
+            if col == 0:
+                return str(index.row() + 1)
+            row = self._rows[index.row()]
+            return row[col - 1] if col - 1 < len(row) else ""
+        if role == QtCore.Qt.ToolTipRole and col > 0:
+            # 单元格按列宽中间省略显示，悬停给出完整路径
+            row = self._rows[index.row()]
+            return row[col - 1] if col - 1 < len(row) else None
+        if role == QtCore.Qt.TextAlignmentRole and col == 0:
+            return int(QtCore.Qt.AlignCenter)
+        return None
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole):  # noqa: N802
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal and section < len(self._headers):
+            return self._headers[section]
+        return None
+
+
+def build_summary_rows(summary: Dict) -> Dict[str, List[tuple]]:
+    """Materialize the four summary tables' rows from a run_pipeline summary."""
+    # 重命名目录、失效引用所在文件大量重复，同一路径只归一化一次
+    normalized: Dict[str, str] = {}
+
+    def norm(path: str) -> str:
+        result = normalized.get(path)
+        if result is None:
+            result = normalized[path] = normalize_display_path(path)
+        return result
+
+    return {
+        "rename": [
+            (item.get("old", ""), item.get("new", ""), norm(item.get("path", "")))
+            for item in summary.get("rename_details", [])
+        ],
+        "fixed": [
+            (p.rpartition("/")[2], norm(p))
+            for p in summary.get("fixed_files", [])
+        ],
+        "dup": [
+            (item.get("name", ""), norm(item.get("path", "")))
+            for item in summary.get("duplicate_list", [])
+        ],
+        "invalid": [
+            (norm(item.get("file", "")), item.get("link", ""))
+            for item in summary.get("invalid_references", [])
+        ],
+    }
+
+
 class SystemSettingsDialog(QtWidgets.QDialog):
     def __init__(self, current_data_dir: str, parent: Optional[QtWidgets.QWidget] = None):
         super().__init__(parent)
@@ -113,7 +328,7 @@ class SystemSettingsDialog(QtWidgets.QDialog):
 
         row = QtWidgets.QHBoxLayout()
         self.data_dir_input = QtWidgets.QLineEdit()
-        self.data_dir_input.setPlaceholderText("运行时生成的临时/报告文件目录（可选）")
+        self.data_dir_input.setPlaceholderText("运行报告输出目录（可选）")
         self.data_dir_input.setText(current_data_dir or "")
         browse_btn = QtWidgets.QPushButton("浏览")
         browse_btn.setObjectName("SoftButton")
@@ -164,8 +379,15 @@ class ProjectDialog(QtWidgets.QDialog):
         self.setSizeGripEnabled(True)
         self._is_new = is_new
         self._name_edited = False
-        self._existing_projects = existing_projects or []
-        self._editing_index = editing_index
+        # 查重用的根目录/名称在打开对话框时归一化一次，保存时只做比较；正在编辑的项目本身不参与
+        self._existing_keys = [
+            (
+                os.path.normcase(normalize_display_path(str(proj.get("root") or ""))),
+                str(proj.get("name") or "").strip(),
+            )
+            for idx, proj in enumerate(existing_projects or [])
+            if idx != editing_index
+        ]
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(14, 14, 14, 14)
@@ -179,7 +401,7 @@ class ProjectDialog(QtWidgets.QDialog):
 
         self.name_input = QtWidgets.QLineEdit()
         self.name_input.setPlaceholderText("例如：Obsidian 笔记库")
-        self.name_input.textEdited.connect(self._on_name_edited)
+        self.name_input.editingFinished.connect(self._on_name_edited)
         form.addRow("名称", self.name_input)
 
         root_row = QtWidgets.QHBoxLayout()
@@ -192,24 +414,8 @@ class ProjectDialog(QtWidgets.QDialog):
         root_row.addWidget(root_btn)
         form.addRow("根目录", root_row)
 
-        self.category_container = QtWidgets.QWidget()
-        cat_layout = QtWidgets.QHBoxLayout(self.category_container)
-        cat_layout.setContentsMargins(0, 0, 0, 0)
-        cat_layout.setSpacing(8)
-        self.category_boxes: Dict[str, QtWidgets.QCheckBox] = {}
-        for key in RENAMING_CATEGORIES.keys():
-            cb = QtWidgets.QCheckBox(CATEGORY_LABELS.get(key, key))
-            cb.setProperty("cat-key", key)
-            cb.stateChanged.connect(self._on_category_changed)
-            self.category_boxes[key] = cb
-            cat_layout.addWidget(cb)
-        cb_all = QtWidgets.QCheckBox(CATEGORY_LABELS.get("all", "all"))
-        cb_all.setProperty("cat-key", "all")
-        cb_all.stateChanged.connect(self._on_category_changed)
-        self.category_boxes["all"] = cb_all
-        cat_layout.addWidget(cb_all)
-        cat_layout.addStretch()
-        form.addRow("重命名类型", self.category_container)
+        self.category_picker = CategoryPicker()
+        form.addRow("重命名类型", self.category_picker)
 
         layout.addLayout(form)
 
@@ -232,7 +438,9 @@ class ProjectDialog(QtWidgets.QDialog):
         self.adjustSize()
 
     def _on_name_edited(self):
-        self._name_edited = True
+        # editingFinished 在失焦/回车时触发一次；仅当确实填了名称才视为用户自定义
+        if self.name_input.text().strip():
+            self._name_edited = True
 
     def _browse_root(self):
         path = QtWidgets.QFileDialog.getExistingDirectory(self, "选择笔记根目录", get_app_root())
@@ -243,40 +451,16 @@ class ProjectDialog(QtWidgets.QDialog):
         if self._is_new and not self._name_edited and not self.name_input.text().strip():
             self.name_input.setText(os.path.basename(path) or "未命名项目")
 
-    def _on_category_changed(self):
-        sender = self.sender()
-        if not isinstance(sender, QtWidgets.QCheckBox):
-            return
-        cat_key = sender.property("cat-key")
-        if cat_key == "all" and sender.isChecked():
-            for key, box in self.category_boxes.items():
-                if key != "all":
-                    box.setChecked(False)
-        elif cat_key != "all" and sender.isChecked():
-            all_box = self.category_boxes.get("all")
-            if all_box:
-                all_box.blockSignals(True)
-                all_box.setChecked(False)
-                all_box.blockSignals(False)
-
     def set_project(self, project: Dict[str, object]):
         self.name_input.setText(str(project.get("name") or ""))
         self.root_input.setText(normalize_display_path(str(project.get("root") or "")))
-        normalized = normalize_categories(list(project.get("categories") or [DEFAULT_RENAME_CATEGORY]))
-        for key, box in self.category_boxes.items():
-            box.blockSignals(True)
-            box.setChecked(key in normalized)
-            box.blockSignals(False)
-        if not normalized:
-            self.category_boxes[DEFAULT_RENAME_CATEGORY].setChecked(True)
+        self.category_picker.set_values(list(project.get("categories") or [DEFAULT_RENAME_CATEGORY]))
 
     def project(self) -> Dict[str, object]:
-        selected = [key for key, box in self.category_boxes.items() if box.isChecked()]
-        normalized = normalize_categories(selected)
         return {
             "name": self.name_input.text().strip() or "未命名项目",
             "root": normalize_display_path(self.root_input.text().strip()),
-            "categories": normalized or [DEFAULT_RENAME_CATEGORY],
+            "categories": self.category_picker.values(),
         }
 
     def _on_accept(self):
@@ -285,16 +469,13 @@ class ProjectDialog(QtWidgets.QDialog):
             QtWidgets.QMessageBox.warning(self, "缺少路径", "请先选择根目录。")
             return
 
-        root_norm = os.path.normcase(normalize_display_path(str(data["root"])))
-        name_norm = str(data.get("name") or "").strip()
-        for idx, proj in enumerate(self._existing_projects):
-            if self._editing_index is not None and idx == self._editing_index:
-                continue
-            other_root = normalize_display_path(str(proj.get("root") or ""))
-            if other_root and os.path.normcase(other_root) == root_norm:
+        # project() 已完成 strip 与路径归一化，这里只需 normcase
+        root_norm = os.path.normcase(str(data["root"]))
+        name_norm = str(data["name"])
+        for other_root, other_name in self._existing_keys:
+            if other_root and other_root == root_norm:
                 QtWidgets.QMessageBox.warning(self, "项目重复", "已存在相同的根目录项目，请勿重复添加。")
                 return
-            other_name = str(proj.get("name") or "").strip()
             if other_name and name_norm and other_name == name_norm:
                 QtWidgets.QMessageBox.warning(self, "项目名称重复", "已存在相同名称的项目，请修改名称以便区分。")
                 return
@@ -321,11 +502,7 @@ class FirstRunWizard(QtWidgets.QDialog):
         layout.addWidget(desc)
 
         # System settings
-        sys_card = QtWidgets.QFrame()
-        sys_card.setObjectName("Card")
-        sys_layout = QtWidgets.QVBoxLayout(sys_card)
-        sys_layout.setContentsMargins(14, 12, 14, 12)
-        sys_layout.setSpacing(10)
+        sys_card, sys_layout = make_card(spacing=10)
         sys_title = QtWidgets.QLabel("系统设置")
         sys_title.setObjectName("SectionTitle")
         sys_layout.addWidget(sys_title)
@@ -348,11 +525,7 @@ class FirstRunWizard(QtWidgets.QDialog):
         layout.addWidget(sys_card)
 
         # Project settings
-        proj_card = QtWidgets.QFrame()
-        proj_card.setObjectName("Card")
-        proj_layout = QtWidgets.QVBoxLayout(proj_card)
-        proj_layout.setContentsMargins(14, 12, 14, 12)
-        proj_layout.setSpacing(10)
+        proj_card, proj_layout = make_card(spacing=10)
         proj_title = QtWidgets.QLabel("创建项目")
         proj_title.setObjectName("SectionTitle")
         proj_layout.addWidget(proj_title)
@@ -363,7 +536,7 @@ class FirstRunWizard(QtWidgets.QDialog):
 
         self.name_input = QtWidgets.QLineEdit()
         self.name_input.setPlaceholderText("例如：Obsidian 笔记库")
-        self.name_input.textEdited.connect(self._on_name_edited)
+        self.name_input.editingFinished.connect(self._on_name_edited)
         proj_form.addRow("名称", self.name_input)
 
         root_row = QtWidgets.QHBoxLayout()
@@ -376,24 +549,8 @@ class FirstRunWizard(QtWidgets.QDialog):
         root_row.addWidget(root_btn)
         proj_form.addRow("根目录", root_row)
 
-        self.category_container = QtWidgets.QWidget()
-        cat_layout = QtWidgets.QHBoxLayout(self.category_container)
-        cat_layout.setContentsMargins(0, 0, 0, 0)
-        cat_layout.setSpacing(8)
-        self.category_boxes: Dict[str, QtWidgets.QCheckBox] = {}
-        for key in RENAMING_CATEGORIES.keys():
-            cb = QtWidgets.QCheckBox(CATEGORY_LABELS.get(key, key))
-            cb.setProperty("cat-key", key)
-            cb.stateChanged.connect(self._on_category_changed)
-            self.category_boxes[key] = cb
-            cat_layout.addWidget(cb)
-        cb_all = QtWidgets.QCheckBox(CATEGORY_LABELS.get("all", "all"))
-        cb_all.setProperty("cat-key", "all")
-        cb_all.stateChanged.connect(self._on_category_changed)
-        self.category_boxes["all"] = cb_all
-        cat_layout.addWidget(cb_all)
-        cat_layout.addStretch()
-        proj_form.addRow("重命名类型", self.category_container)
+        self.category_picker = CategoryPicker()
+        proj_form.addRow("重命名类型", self.category_picker)
 
         proj_layout.addLayout(proj_form)
         layout.addWidget(proj_card, stretch=1)
@@ -410,7 +567,7 @@ class FirstRunWizard(QtWidgets.QDialog):
         btn_row.addWidget(ok_btn)
         layout.addLayout(btn_row)
 
-        self._set_default_categories([DEFAULT_RENAME_CATEGORY])
+        self.category_picker.set_values([DEFAULT_RENAME_CATEGORY])
 
     def _browse_data_dir(self):
         path = QtWidgets.QFileDialog.getExistingDirectory(self, "选择数据目录", get_app_root())
@@ -418,7 +575,9 @@ class FirstRunWizard(QtWidgets.QDialog):
             self.data_dir_input.setText(normalize_display_path(path))
 
     def _on_name_edited(self):
-        self._name_edited = True
+        # editingFinished 在失焦/回车时触发一次；仅当确实填了名称才视为用户自定义
+        if self.name_input.text().strip():
+            self._name_edited = True
 
     def _browse_root(self):
         path = QtWidgets.QFileDialog.getExistingDirectory(self, "选择笔记根目录", get_app_root())
@@ -429,39 +588,14 @@ class FirstRunWizard(QtWidgets.QDialog):
         if not self._name_edited and not self.name_input.text().strip():
             self.name_input.setText(os.path.basename(path) or "未命名项目")
 
-    def _on_category_changed(self):
-        sender = self.sender()
-        if not isinstance(sender, QtWidgets.QCheckBox):
-            return
-        cat_key = sender.property("cat-key")
-        if cat_key == "all" and sender.isChecked():
-            for key, box in self.category_boxes.items():
-                if key != "all":
-                    box.setChecked(False)
-        elif cat_key != "all" and sender.isChecked():
-            all_box = self.category_boxes.get("all")
-            if all_box:
-                all_box.blockSignals(True)
-                all_box.setChecked(False)
-                all_box.blockSignals(False)
-
-    def _set_default_categories(self, categories: List[str]):
-        normalized = normalize_categories(categories)
-        for key, box in self.category_boxes.items():
-            box.blockSignals(True)
-            box.setChecked(key in normalized)
-            box.blockSignals(False)
-
     def data_dir(self) -> str:
         return normalize_display_path(self.data_dir_input.text().strip())
 
     def project(self) -> Dict[str, object]:
-        selected = [key for key, box in self.category_boxes.items() if box.isChecked()]
-        normalized = normalize_categories(selected)
         return {
             "name": self.name_input.text().strip() or "未命名项目",
             "root": normalize_display_path(self.root_input.text().strip()),
-            "categories": normalized or [DEFAULT_RENAME_CATEGORY],
+            "categories": self.category_picker.values(),
         }
 
     def _on_accept(self):
@@ -479,6 +613,10 @@ class ProjectCardWidget(QtWidgets.QFrame):
     open_requested = QtCore.Signal(int)
     remove_requested = QtCore.Signal(int)
 
+    TRASH_PIXMAP = getattr(QtWidgets.QStyle, "SP_TrashIcon", QtWidgets.QStyle.SP_DialogCloseButton)
+    # 所有卡片共用同一组标准图标；QIcon 隐式共享，缓存后每张卡片不再向样式重新查询
+    _icon_cache: Dict[QtWidgets.QStyle.StandardPixmap, QtGui.QIcon] = {}
+
     def __init__(self, index: int, name: str, root: str, categories: List[str], parent: Optional[QtWidgets.QWidget] = None):
         super().__init__(parent)
         self.index = index
@@ -495,7 +633,8 @@ class ProjectCardWidget(QtWidgets.QFrame):
         self.name_label.setObjectName("ProjectName")
         header.addWidget(self.name_label)
         header.addStretch()
-        header.addWidget(TagChip(category_label_from_types(categories)))
+        self.tag_chip = TagChip(category_label_from_types(categories))
+        header.addWidget(self.tag_chip)
         layout.addLayout(header)
 
         self.root_label = QtWidgets.QLabel(root or "")
@@ -509,27 +648,26 @@ class ProjectCardWidget(QtWidgets.QFrame):
         self.run_btn = QtWidgets.QToolButton()
         self.run_btn.setObjectName("ActionButtonPrimary")
         self.run_btn.setToolTip("运行")
-        self.run_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay))
-        self.run_btn.clicked.connect(lambda: self.run_requested.emit(self.index))
+        self.run_btn.setIcon(self._standard_icon(QtWidgets.QStyle.SP_MediaPlay))
+        self.run_btn.clicked.connect(self._emit_run)
 
         self.details_btn = QtWidgets.QToolButton()
         self.details_btn.setObjectName("ActionButton")
         self.details_btn.setToolTip("详情")
-        self.details_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_MessageBoxInformation))
-        self.details_btn.clicked.connect(lambda: self.details_requested.emit(self.index))
+        self.details_btn.setIcon(self._standard_icon(QtWidgets.QStyle.SP_MessageBoxInformation))
+        self.details_btn.clicked.connect(self._emit_details)
 
         self.open_btn = QtWidgets.QToolButton()
         self.open_btn.setObjectName("ActionButton")
         self.open_btn.setToolTip("打开根目录")
-        self.open_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_DirOpenIcon))
-        self.open_btn.clicked.connect(lambda: self.open_requested.emit(self.index))
+        self.open_btn.setIcon(self._standard_icon(QtWidgets.QStyle.SP_DirOpenIcon))
+        self.open_btn.clicked.connect(self._emit_open)
 
         self.remove_btn = QtWidgets.QToolButton()
         self.remove_btn.setObjectName("ActionButtonDanger")
         self.remove_btn.setToolTip("删除")
-        icon = self.style().standardIcon(getattr(QtWidgets.QStyle, "SP_TrashIcon", QtWidgets.QStyle.SP_DialogCloseButton))
-        self.remove_btn.setIcon(icon)
-        self.remove_btn.clicked.connect(lambda: self.remove_requested.emit(self.index))
+        self.remove_btn.setIcon(self._standard_icon(self.TRASH_PIXMAP))
+        self.remove_btn.clicked.connect(self._emit_remove)
 
         for btn in (self.run_btn, self.details_btn, self.open_btn, self.remove_btn):
             btn.setAutoRaise(True)
@@ -539,12 +677,42 @@ class ProjectCardWidget(QtWidgets.QFrame):
             btn_row.addWidget(btn)
         layout.addLayout(btn_row)
 
+    # 按钮连接到绑定方法而非闭包；卡片复用时 index 会被 set_project 改写，故在点击时读取
+    def _emit_run(self):
+        self.run_requested.emit(self.index)
+
+    def _emit_details(self):
+        self.details_requested.emit(self.index)
+
+    def _emit_open(self):
+        self.open_requested.emit(self.index)
+
+    def _emit_remove(self):
+        self.remove_requested.emit(self.index)
+
+    def _standard_icon(self, pixmap: QtWidgets.QStyle.StandardPixmap) -> QtGui.QIcon:
+        icon = self._icon_cache.get(pixmap)
+        if icon is None:
+            icon = self._icon_cache[pixmap] = self.style().standardIcon(pixmap)
+        return icon
+
+    def set_project(self, index: int, name: str, root: str, categories: List[str]):
+        """Reuse this card for another project entry without rebuilding its widgets."""
+        self.index = index
+        self.name_label.setText(name or "未命名项目")
+        self.root_label.setText(root or "")
+        self.tag_chip.setText(category_label_from_types(categories))
+
     def mousePressEvent(self, event: QtGui.QMouseEvent):  # noqa: N802
         self.selected.emit(self.index)
         super().mousePressEvent(event)
 
     def set_selected(self, selected: bool):
-        self.setProperty("selected", bool(selected))
+        selected = bool(selected)
+        # 属性未变化时不重新套用样式，切换选中时只有新旧两张卡片需要 repolish
+        if self.property("selected") == selected:
+            return
+        self.setProperty("selected", selected)
         self.style().unpolish(self)
         self.style().polish(self)
 
@@ -602,24 +770,8 @@ class ProjectEditor(QtWidgets.QWidget):
         root_row.addWidget(root_btn)
         form.addRow("根目录", root_row)
 
-        self.category_container = QtWidgets.QWidget()
-        cat_layout = QtWidgets.QHBoxLayout(self.category_container)
-        cat_layout.setContentsMargins(0, 0, 0, 0)
-        cat_layout.setSpacing(8)
-        self.category_boxes: Dict[str, QtWidgets.QCheckBox] = {}
-        for key in RENAMING_CATEGORIES.keys():
-            cb = QtWidgets.QCheckBox(CATEGORY_LABELS.get(key, key))
-            cb.setProperty("cat-key", key)
-            cb.stateChanged.connect(self._on_category_changed)
-            self.category_boxes[key] = cb
-            cat_layout.addWidget(cb)
-        cb_all = QtWidgets.QCheckBox(CATEGORY_LABELS.get("all", "all"))
-        cb_all.setProperty("cat-key", "all")
-        cb_all.stateChanged.connect(self._on_category_changed)
-        self.category_boxes["all"] = cb_all
-        cat_layout.addWidget(cb_all)
-        cat_layout.addStretch()
-        form.addRow("重命名类型", self.category_container)
+        self.category_picker = CategoryPicker()
+        form.addRow("重命名类型", self.category_picker)
 
         layout.addLayout(form)
 
@@ -638,43 +790,19 @@ class ProjectEditor(QtWidgets.QWidget):
 
         self.setLayout(layout)
 
-    def _on_category_changed(self):
-        sender = self.sender()
-        if not isinstance(sender, QtWidgets.QCheckBox):
-            return
-        cat_key = sender.property("cat-key")
-        if cat_key == "all" and sender.isChecked():
-            for key, box in self.category_boxes.items():
-                if key != "all":
-                    box.setChecked(False)
-        elif cat_key != "all" and sender.isChecked():
-            all_box = self.category_boxes.get("all")
-            if all_box:
-                all_box.blockSignals(True)
-                all_box.setChecked(False)
-                all_box.blockSignals(False)
-
     def set_status(self, text: str):
         self.status_label.setText(text)
 
     def set_fields(self, name: str, root: str, categories: List[str]):
         self.name_input.setText(name)
         self.root_input.setText(root)
-        normalized = normalize_categories(categories)
-        for key, box in self.category_boxes.items():
-            box.blockSignals(True)
-            box.setChecked(key in normalized)
-            box.blockSignals(False)
-        if not normalized:
-            self.category_boxes[DEFAULT_RENAME_CATEGORY].setChecked(True)
+        self.category_picker.set_values(categories)
 
     def get_fields(self) -> Dict[str, object]:
-        selected = [key for key, box in self.category_boxes.items() if box.isChecked()]
-        normalized = normalize_categories(selected)
         return {
             "name": self.name_input.text().strip() or "未命名项目",
             "root": normalize_display_path(self.root_input.text().strip()),
-            "categories": normalized or [DEFAULT_RENAME_CATEGORY],
+            "categories": self.category_picker.values(),
         }
 
     def set_running(self, running: bool):
@@ -685,19 +813,61 @@ class ProjectEditor(QtWidgets.QWidget):
 
 
 class MainWindow(QtWidgets.QMainWindow):
+    _logo_icon: Optional[QtGui.QIcon] = None
+
     def __init__(self, default_root: Optional[str] = None):
         super().__init__()
         self.setWindowTitle("Markdown 链接修复器 (PySide6)")
-        if os.path.exists(LOGO_PATH):
-            self.setWindowIcon(QtGui.QIcon(LOGO_PATH))
         self.projects: List[Dict] = []
+        self.project_cards: List[ProjectCardWidget] = []
+        self._card_pool: List[ProjectCardWidget] = []
         self.settings: Dict = {}
         self.current_index: Optional[int] = None
-        self.active_worker: Optional[PipelineWorker] = None
+        self.active_signals: Optional[PipelineSignals] = None
+        self.active_log_handler: Optional[SignalLogHandler] = None
+        # 运行期间定时冲刷日志缓冲，避免长时间无新日志时已有日志滞留
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setInterval(int(SignalLogHandler.FLUSH_INTERVAL * 1000))
+        self._log_flush_timer.timeout.connect(self._flush_active_logs)
+        # run_pipeline 会重置全局 logging，同一时间只能跑一个任务；池内线程在任务间复用
+        self.pipeline_pool = QtCore.QThreadPool(self)
+        self.pipeline_pool.setMaxThreadCount(1)
         self.latest_summary: Optional[Dict] = None
+        self._pending_rows: Optional[Dict[str, List[tuple]]] = None
+        # 连续的增删改只在最后一次变更 300ms 后写一次配置
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(self._flush_save)
         self._build_ui()
+        # 图标解码与读取配置（可能弹出首次引导）推迟到事件循环启动后，窗口先完成首帧绘制
+        QtCore.QTimer.singleShot(0, lambda: self._deferred_init(default_root))
+
+    def _deferred_init(self, default_root: Optional[str]):
+        icon = self._load_logo_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
         self._load_state(default_root)
 
+    @classmethod
+    def _load_logo_icon(cls) -> Optional[QtGui.QIcon]:
+        if cls._logo_icon is None and os.path.exists(LOGO_PATH):
+            cls._logo_icon = QtGui.QIcon(LOGO_PATH)
+        return cls._logo_icon
+
+    def _schedule_save(self):
+        self._save_timer.start()
+
+    def _flush_save(self):
+        self._save_timer.stop()
+        save_projects_config(self.projects, self.settings)
+
+    def closeEvent(self, event: QtGui.QCloseEvent):  # noqa: N802
+        # 退出前落盘尚未触发的延迟保存
+        if self._save_timer.isActive():
+            self._flush_save()
+        super().closeEvent(event)
+
     def _build_ui(self):
         self.resize(1100, 720)
         self._build_menu()
@@ -708,11 +878,7 @@ class MainWindow(QtWidgets.QMainWindow):
         root_layout.setSpacing(12)
 
         # Left panel (项目卡片 + 详情面板)
-        left_card = QtWidgets.QFrame()
-        left_card.setObjectName("Card")
-        left_layout = QtWidgets.QVBoxLayout(left_card)
-        left_layout.setContentsMargins(14, 14, 14, 14)
-        left_layout.setSpacing(10)
+        left_card, left_layout = make_card(spacing=10, margins=(14, 14, 14, 14))
         header = QtWidgets.QHBoxLayout()
         title = QtWidgets.QLabel("项目列表")
         title.setObjectName("SectionTitle")
@@ -745,11 +911,7 @@ class MainWindow(QtWidgets.QMainWindow):
         right_layout = QtWidgets.QVBoxLayout()
         right_layout.setSpacing(10)
 
-        info_card = QtWidgets.QFrame()
-        info_card.setObjectName("Card")
-        info_layout = QtWidgets.QVBoxLayout(info_card)
-        info_layout.setContentsMargins(14, 12, 14, 12)
-        info_layout.setSpacing(4)
+        info_card, info_layout = make_card(spacing=4)
         info_title = QtWidgets.QLabel("当前项目")
         info_title.setObjectName("SectionTitle")
         info_layout.addWidget(info_title)
@@ -765,6 +927,9 @@ class MainWindow(QtWidgets.QMainWindow):
         logs_tab = QtWidgets.QWidget()
         deck.addTab(summary_tab, "运行概览")
         deck.addTab(logs_tab, "日志")
+        deck.currentChanged.connect(self._on_deck_changed)
+        self.deck = deck
+        self.summary_tab = summary_tab
         right_layout.addWidget(deck, stretch=1)
 
         # Summary layout (outer scroll + per-table scroll)
@@ -773,6 +938,7 @@ class MainWindow(QtWidgets.QMainWindow):
         summary_scroll.setFrameShape(QtWidgets.QFrame.NoFrame)
         summary_container = QtWidgets.QWidget()
         summary_scroll.setWidget(summary_container)
+        self.summary_container = summary_container
 
         summary_layout = QtWidgets.QVBoxLayout(summary_container)
         summary_layout.setContentsMargins(4, 8, 4, 8)
@@ -796,20 +962,20 @@ class MainWindow(QtWidgets.QMainWindow):
         summary_layout.addLayout(card_row)
 
         # 分表展示不同数据（默认最多显示 10 行，其余用表格滚动）
-        self.rename_table = QtWidgets.QTableWidget(0, 4)
-        self.rename_table.setHorizontalHeaderLabels(["序号", "旧文件", "新文件", "所在路径"])
+        self.rename_table = QtWidgets.QTableView()
+        self.rename_table.setModel(SummaryTableModel(["序号", "旧文件", "新文件", "所在路径"], self.rename_table))
         self._init_table(self.rename_table)
 
-        self.fixed_table = QtWidgets.QTableWidget(0, 3)
-        self.fixed_table.setHorizontalHeaderLabels(["序号", "Markdown 文件", "路径"])
+        self.fixed_table = QtWidgets.QTableView()
+        self.fixed_table.setModel(SummaryTableModel(["序号", "Markdown 文件", "路径"], self.fixed_table))
         self._init_table(self.fixed_table)
 
-        self.dup_table = QtWidgets.QTableWidget(0, 3)
-        self.dup_table.setHorizontalHeaderLabels(["序号", "文件名", "路径"])
+        self.dup_table = QtWidgets.QTableView()
+        self.dup_table.setModel(SummaryTableModel(["序号", "文件名", "路径"], self.dup_table))
         self._init_table(self.dup_table)
 
-        self.invalid_table = QtWidgets.QTableWidget(0, 3)
-        self.invalid_table.setHorizontalHeaderLabels(["序号", "Markdown 文件", "失效引用"])
+        self.invalid_table = QtWidgets.QTableView()
+        self.invalid_table.setModel(SummaryTableModel(["序号", "Markdown 文件", "失效引用"], self.invalid_table))
         self._init_table(self.invalid_table)
 
         summary_layout.addWidget(self._wrap_table("重命名详情", self.rename_table))
@@ -823,6 +989,8 @@ class MainWindow(QtWidgets.QMainWindow):
         logs_layout.setSpacing(6)
         self.log_view = QtWidgets.QPlainTextEdit()
         self.log_view.setReadOnly(True)
+        # 日志按批追加（见 SignalLogHandler），同时限制总行数，超长运行时丢弃最早的日志
+        self.log_view.setMaximumBlockCount(20000)
         logs_layout.addWidget(self.log_view)
 
         root_layout.addLayout(right_layout, stretch=2)
@@ -830,48 +998,56 @@ class MainWindow(QtWidgets.QMainWindow):
         # Style
         self._apply_style()
 
-    def _init_table(self, table: QtWidgets.QTableWidget):
+    def _init_table(self, table: QtWidgets.QTableView):
         table.horizontalHeader().setStretchLastSection(True)
         table.verticalHeader().setVisible(False)
         table.verticalHeader().setDefaultSectionSize(26)
+        # 行高固定、列宽不按内容计算，视图只需绘制可见行，与数据量无关
+        table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        # 列宽按视图宽度均分，长路径由委托在绘制可见单元格时中间省略，不出现横向滚动条
+        table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        table.setTextElideMode(QtCore.Qt.ElideMiddle)
+        table.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
         table.setAlternatingRowColors(True)
         table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         table.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
         table.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
         table.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
-        table.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
+        table.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         table.setWordWrap(False)
 
-        if table.columnCount() > 0:
-            header_item = table.horizontalHeaderItem(0)
-            if header_item and header_item.text() == "序号":
-                table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Fixed)
-                table.setColumnWidth(0, 64)
+        if table.model().headerData(0, QtCore.Qt.Horizontal) == "序号":
+            table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Fixed)
+            table.setColumnWidth(0, 64)
 
         self._update_table_height(table, row_count=0)
 
-    def _wrap_table(self, title: str, table: QtWidgets.QTableWidget) -> QtWidgets.QWidget:
-        wrapper = QtWidgets.QFrame()
-        wrapper.setObjectName("Card")
-        layout = QtWidgets.QVBoxLayout(wrapper)
-        layout.setContentsMargins(14, 12, 14, 12)
-        layout.setSpacing(8)
+    def _wrap_table(self, title: str, table: QtWidgets.QTableView) -> QtWidgets.QWidget:
+        wrapper, layout = make_card(spacing=8)
         label = QtWidgets.QLabel(title)
         label.setObjectName("SectionTitle")
         layout.addWidget(label)
         layout.addWidget(table)
         return wrapper
 
-    def _update_table_height(self, table: QtWidgets.QTableWidget, row_count: int, max_visible_rows: int = 10):
+    def _update_table_height(self, table: QtWidgets.QTableView, row_count: int, max_visible_rows: int = 10):
         visible_rows = min(max(row_count, 1), max_visible_rows)
-        header_height = table.horizontalHeader().sizeHint().height()
+        # 表头高度只随字体/DPI 变化；表格初始化时尚未应用样式表，显示后才缓存
+        header_height = table.property("_hdr_h")
+        if header_height is None:
+            header_height = table.horizontalHeader().sizeHint().height()
+            if table.isVisible():
+                table.setProperty("_hdr_h", header_height)
         row_height = table.verticalHeader().defaultSectionSize()
         frame = table.frameWidth() * 2
         scrollbar_height = 0
         if table.horizontalScrollBarPolicy() != QtCore.Qt.ScrollBarAlwaysOff and table.horizontalScrollBar().isVisible():
             scrollbar_height = table.horizontalScrollBar().sizeHint().height()
         extra = 8
-        table.setFixedHeight(header_height + (visible_rows * row_height) + frame + scrollbar_height + extra)
+        height = header_height + (visible_rows * row_height) + frame + scrollbar_height + extra
+        # 高度未变时不再 setFixedHeight，避免无谓地使父级布局失效
+        if table.maximumHeight() != height or table.minimumHeight() != height:
+            table.setFixedHeight(height)
 
     def _apply_style(self):
         palette = self.palette()
@@ -879,45 +1055,10 @@ class MainWindow(QtWidgets.QMainWindow):
         palette.setColor(QtGui.QPalette.Base, QtGui.QColor("#ffffff"))
         palette.setColor(QtGui.QPalette.Text, QtGui.QColor("#1f2937"))
         self.setPalette(palette)
-        self.setStyleSheet(
-            """
-            QWidget { font-family: 'Segoe UI', 'Microsoft YaHei', sans-serif; font-size: 13px; color: #1f2937; }
-            QFrame#Card { background: #ffffff; border: 1px solid #e5e7eb; border-radius: 12px; }
-            QLabel#SectionTitle { font-size: 16px; font-weight: 700; }
-            QLabel#Muted { color: #6b7280; }
-            QLabel#CardTitle { color: #6b7280; font-size: 12px; }
-            QLabel#CardValue { font-size: 22px; font-weight: 700; color: #111827; }
-            QFrame#ProjectCard { background: #ffffff; border: 1px solid #e5e7eb; border-radius: 12px; }
-            QFrame#ProjectCard[selected=\"true\"] { border: 2px solid #2563eb; }
-            QLabel#ProjectName { font-size: 14px; font-weight: 700; }
-            QLabel#ProjectMeta { color: #6b7280; }
-            QPushButton { background: #2563eb; color: white; padding: 8px 14px; border-radius: 8px; border: none; }
-            QPushButton:hover { background: #1d4ed8; }
-            QPushButton:disabled { background: #93c5fd; }
-            QPushButton#SoftButton { background: #f3f4f6; color: #111827; border: 1px solid #e5e7eb; }
-            QPushButton#SoftButton:hover { background: #e5e7eb; }
-            QToolButton#ActionButton,
-            QToolButton#ActionButtonPrimary,
-            QToolButton#ActionButtonDanger {
-                border-radius: 10px;
-                border: 1px solid #e5e7eb;
-                background: #ffffff;
-            }
-            QToolButton#ActionButton:hover { background: #f3f4f6; }
-            QToolButton#ActionButtonPrimary { border: none; background: #2563eb; color: white; }
-            QToolButton#ActionButtonPrimary:hover { background: #1d4ed8; }
-            QToolButton#ActionButtonPrimary:disabled { background: #93c5fd; }
-            QToolButton#ActionButtonDanger { background: #fff1f2; border: 1px solid #fecdd3; }
-            QToolButton#ActionButtonDanger:hover { background: #ffe4e6; }
-            QLineEdit { border: 1px solid #d1d5db; border-radius: 8px; padding: 8px; }
-            QTabWidget::pane { border: 1px solid #e5e7eb; border-radius: 10px; padding: 6px; }
-            QTabBar::tab { padding: 8px 14px; margin-right: 4px; border: 1px solid #e5e7eb; border-bottom: none; border-top-left-radius: 8px; border-top-right-radius: 8px; background: #f3f4f6; }
-            QTabBar::tab:selected { background: #ffffff; color: #1f2937; }
-            QPlainTextEdit { border: 1px solid #e5e7eb; border-radius: 10px; background: #0f172a; color: #e2e8f0; font-family: 'JetBrains Mono', 'Consolas', monospace; }
-            QTableWidget { border: 1px solid #e5e7eb; border-radius: 10px; }
-            QHeaderView::section { background: #f3f4f6; padding: 6px; border: none; }
-            """
-        )
+        # 样式表挂在 QApplication 上，整个进程只解析一次，对话框与后续窗口直接复用
+        app = QtWidgets.QApplication.instance()
+        if app is not None and app.styleSheet() != APP_STYLESHEET:
+            app.setStyleSheet(APP_STYLESHEET)
 
     def _build_menu(self):
         menu = self.menuBar().addMenu("设置")
@@ -950,27 +1091,44 @@ class MainWindow(QtWidgets.QMainWindow):
             self.projects = [proj] + self.projects
             self.current_index = 0
         self.settings["has_seen_wizard"] = True
-        save_projects_config(self.projects, self.settings)
-
-    def refresh_project_list(self, select_first: bool = False):
-        while self.project_cards_layout.count() > 1:
-            item = self.project_cards_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        self._schedule_save()
+
+    def _sync_project_cards(self):
+        # Reuse existing cards. Surplus cards are hidden and parked in a pool that sits
+        # right after the visible cards in the layout, so growing again just re-shows them.
+        while len(self.project_cards) > len(self.projects):
+            card = self.project_cards.pop()
+            card.setVisible(False)
+            self._card_pool.insert(0, card)
         for idx, proj in enumerate(self.projects):
-            card = ProjectCardWidget(
-                index=idx,
-                name=proj.get("name", "未命名项目"),
-                root=normalize_display_path(proj.get("root", "")),
-                categories=proj.get("categories") or [DEFAULT_RENAME_CATEGORY],
-            )
+            name = proj.get("name", "未命名项目")
+            root = normalize_display_path(proj.get("root", ""))
+            categories = proj.get("categories") or [DEFAULT_RENAME_CATEGORY]
+            if idx < len(self.project_cards):
+                self.project_cards[idx].set_project(idx, name, root, categories)
+                continue
+            if self._card_pool:
+                card = self._card_pool.pop(0)
+                card.set_project(idx, name, root, categories)
+                card.setVisible(True)
+                self.project_cards.append(card)
+                continue
+            card = ProjectCardWidget(index=idx, name=name, root=root, categories=categories)
             card.selected.connect(self.select_project)
             card.run_requested.connect(self.run_project)
             card.details_requested.connect(self.show_project_details)
             card.open_requested.connect(self.open_project_root)
             card.remove_requested.connect(self.remove_project_by_index)
-            self.project_cards_layout.insertWidget(self.project_cards_layout.count() - 1, card)
+            self.project_cards_layout.insertWidget(len(self.project_cards), card)
+            self.project_cards.append(card)
+
+    def refresh_project_list(self, select_first: bool = False):
+        # Suspend repaints so the batch of card changes is laid out and painted once.
+        self.project_cards_container.setUpdatesEnabled(False)
+        try:
+            self._sync_project_cards()
+        finally:
+            self.project_cards_container.setUpdatesEnabled(True)
         if self.projects:
             if select_first or self.current_index is None:
                 self.select_project(0, ensure_visible=False)
@@ -989,16 +1147,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.info_label.setText(
             f"{proj.get('name', '未命名项目')}｜{normalize_display_path(proj.get('root', ''))}｜分类：{tags}"
         )
-        for i in range(self.project_cards_layout.count() - 1):
-            w = self.project_cards_layout.itemAt(i).widget()
-            if isinstance(w, ProjectCardWidget):
-                w.set_selected(w.index == index)
-        if ensure_visible:
-            for i in range(self.project_cards_layout.count() - 1):
-                w = self.project_cards_layout.itemAt(i).widget()
-                if isinstance(w, ProjectCardWidget) and w.index == index:
-                    self.project_scroll.ensureWidgetVisible(w)
-                    break
+        self.project_cards_container.setUpdatesEnabled(False)
+        try:
+            for card in self.project_cards:
+                card.set_selected(card.index == index)
+        finally:
+            self.project_cards_container.setUpdatesEnabled(True)
+        if ensure_visible and index < len(self.project_cards):
+            self.project_scroll.ensureWidgetVisible(self.project_cards[index])
 
     # ---------- Actions ----------
 
@@ -1009,23 +1165,36 @@ class MainWindow(QtWidgets.QMainWindow):
         data = dlg.project()
         self.projects.insert(0, data)
         self.current_index = 0
-        save_projects_config(self.projects, self.settings)
+        self._schedule_save()
         self.refresh_project_list(select_first=True)
 
     def _start_pipeline(self, data: Dict[str, object]):
         rename_types = data.get("categories") or [DEFAULT_RENAME_CATEGORY]
         root_dir = str(data.get("root") or "")
         data_dir = self.settings.get("data_dir")
-        self.active_worker = PipelineWorker(
+        task = PipelineTask(
             root_dir,
             list(rename_types),
             data_dir,
             verbose=True,
         )
-        self.active_worker.log.connect(self.append_log)
-        self.active_worker.finished.connect(self.on_run_finished)
-        self.active_worker.failed.connect(self.on_run_failed)
-        self.active_worker.start()
+        self.active_signals = task.signals
+        # 信号总是从线程池线程发出、在 GUI 线程处理，显式排队而不依赖 AutoConnection 的运行时判断
+        queued = QtCore.Qt.QueuedConnection
+        self.active_signals.logs.connect(self.append_logs, queued)
+        self.active_signals.finished.connect(self.on_run_finished, queued)
+        self.active_signals.failed.connect(self.on_run_failed, queued)
+        self.active_log_handler = task.log_handler
+        self._log_flush_timer.start()
+        self.pipeline_pool.start(task)
+
+    def _flush_active_logs(self):
+        if self.active_log_handler is not None:
+            self.active_log_handler.flush()
+
+    def _stop_log_flush(self):
+        self._log_flush_timer.stop()
+        self.active_log_handler = None
 
     def run_project(self, index: int):
         if index < 0 or index >= len(self.projects):
@@ -1055,7 +1224,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if dlg.exec() != QtWidgets.QDialog.Accepted:
             return
         self.projects[index] = dlg.project()
-        save_projects_config(self.projects, self.settings)
+        self._schedule_save()
         self.refresh_project_list(select_first=False)
         self.select_project(index, ensure_visible=True)
 
@@ -1076,7 +1245,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.current_index = None
         elif self.current_index is not None and self.current_index > index:
             self.current_index -= 1
-        save_projects_config(self.projects, self.settings)
+        self._schedule_save()
         self.refresh_project_list(select_first=True)
 
     def _confirm_dialog(self, title: str, message: str) -> bool:
@@ -1097,78 +1266,82 @@ class MainWindow(QtWidgets.QMainWindow):
         dlg = SystemSettingsDialog(current_data_dir=normalize_display_path(self.settings.get("data_dir") or ""), parent=self)
         if dlg.exec() == QtWidgets.QDialog.Accepted:
             self.settings["data_dir"] = dlg.data_dir() or normalize_display_path(os.path.join(get_app_root(), ".data"))
-            save_projects_config(self.projects, self.settings)
+            self._schedule_save()
 
-    def on_run_finished(self, summary: Dict):
+    def on_run_finished(self, summary: Dict, rows: Dict[str, List[tuple]]):
+        self._stop_log_flush()
         self._set_ui_running(False)
         self.latest_summary = summary
         self.statusBar().showMessage("运行完成", 5000)
-        self._render_summary(summary)
-        save_projects_config(self.projects, self.settings)
+        self._render_summary(summary, rows)
 
     def on_run_failed(self, msg: str):
+        self._stop_log_flush()
         self._set_ui_running(False)
         QtWidgets.QMessageBox.critical(self, "运行失败", msg)
         self.statusBar().showMessage("运行失败", 5000)
 
-    def append_log(self, message: str):
-        self.log_view.appendPlainText(message)
-        self.log_view.verticalScrollBar().setValue(self.log_view.verticalScrollBar().maximum())
+    def append_logs(self, messages: List[str]):
+        # 整批一次追加，只触发一次排版与滚动
+        self.log_view.appendPlainText("\n".join(messages))
+        self.log_view.moveCursor(QtGui.QTextCursor.End)
+        self.log_view.ensureCursorVisible()
 
     def _set_ui_running(self, running: bool):
         self.add_btn.setEnabled(not running)
         self.settings_btn.setEnabled(not running)
-        for i in range(self.project_cards_layout.count() - 1):
-            w = self.project_cards_layout.itemAt(i).widget()
-            if isinstance(w, ProjectCardWidget):
-                w.set_running(running)
+        for card in self.project_cards:
+            card.set_running(running)
 
     # ---------- Summary ----------
 
-    def _render_summary(self, summary: Optional[Dict]):
+    def _render_summary(self, summary: Optional[Dict], rows: Optional[Dict[str, List[tuple]]] = None):
         if not summary:
             return
-        self.cards["rename"].set_value(f"{summary.get('renamed_files', 0)}/{summary.get('rename_candidates', 0)}")
         md_files = int(summary.get("markdown_fixed", 0) or 0)
         replacements = int(summary.get("replacements", 0) or 0)
-        self.cards["markdown"].set_value(f"{md_files} 文件 / {replacements} 处")
-        self.cards["duplicates"].set_value(str(len(summary.get("duplicate_list", []))))
-        self.cards["invalid"].set_value(str(summary.get("invalid_reference_count", 0)))
-
-        rename_rows = [
-            (item.get("old", ""), item.get("new", ""), normalize_display_path(item.get("path", "")))
-            for item in summary.get("rename_details", [])
-        ]
-        self._fill_table(self.rename_table, rename_rows, 3)
-
-        fixed_rows = [
-            (os.path.basename(p), normalize_display_path(p))
-            for p in summary.get("fixed_files", [])
-        ]
-        self._fill_table(self.fixed_table, fixed_rows, 2)
-
-        dup_rows = [
-            (item.get("name", ""), normalize_display_path(item.get("path", "")))
-            for item in summary.get("duplicate_list", [])
-        ]
-        self._fill_table(self.dup_table, dup_rows, 2)
-
-        invalid_rows = [
-            (normalize_display_path(item.get("file", "")), item.get("link", ""))
-            for item in summary.get("invalid_references", [])
-        ]
-        self._fill_table(self.invalid_table, invalid_rows, 2)
-
-    def _fill_table(self, table: QtWidgets.QTableWidget, rows: List[tuple], columns: int):
-        if table.columnCount() != columns + 1:
-            table.setColumnCount(columns + 1)
-        table.setRowCount(len(rows))
-        for i, row in enumerate(rows):
-            index_item = QtWidgets.QTableWidgetItem(str(i + 1))
-            index_item.setTextAlignment(QtCore.Qt.AlignCenter)
-            table.setItem(i, 0, index_item)
-            for j in range(columns):
-                table.setItem(i, j + 1, QtWidgets.QTableWidgetItem(row[j] if j < len(row) else ""))
+        values = {
+            "rename": f"{summary.get('renamed_files', 0)}/{summary.get('rename_candidates', 0)}",
+            "markdown": f"{md_files} 文件 / {replacements} 处",
+            "duplicates": str(len(summary.get("duplicate_list", []))),
+            "invalid": str(summary.get("invalid_reference_count", 0)),
+        }
+        # 四张卡片的文本一次性更新，合并为一次布局与重绘
+        card_row = self.cards["rename"].parentWidget()
+        card_row.setUpdatesEnabled(False)
+        try:
+            for key, text in values.items():
+                self.cards[key].set_value(text)
+        finally:
+            card_row.setUpdatesEnabled(True)
+
+        if rows is None:
+            rows = build_summary_rows(summary)
+        # 概览页不可见时先挂起，切换到该页时再填充表格
+        self._pending_rows = rows
+        if self.deck.currentWidget() is self.summary_tab:
+            self._fill_pending_tables()
+
+    def _on_deck_changed(self, _index: int):
+        if self.deck.currentWidget() is self.summary_tab:
+            self._fill_pending_tables()
+
+    def _fill_pending_tables(self):
+        rows, self._pending_rows = self._pending_rows, None
+        if rows is None:
+            return
+        # 四张表的重置与调高合并为一次布局与重绘
+        self.summary_container.setUpdatesEnabled(False)
+        try:
+            self._fill_table(self.rename_table, rows["rename"])
+            self._fill_table(self.fixed_table, rows["fixed"])
+            self._fill_table(self.dup_table, rows["dup"])
+            self._fill_table(self.invalid_table, rows["invalid"])
+        finally:
+            self.summary_container.setUpdatesEnabled(True)
+
+    def _fill_table(self, table: QtWidgets.QTableView, rows: List[tuple]):
+        table.model().set_rows(rows)
         self._update_table_height(table, row_count=len(rows))
 
 